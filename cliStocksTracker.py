@@ -1,10 +1,13 @@
 import io
 import pytz
+import risk
 import utils
 import plotille
 import warnings
 import webcolors
 import autocolors
+import series
+import terminal
 import contextlib
 import configparser
 import argparse
@@ -13,36 +16,39 @@ import numpy as np
 import yfinance as market
 
 from matplotlib import colors
+from collections import deque
 from colorama import Fore, Style
 from datetime import datetime, timedelta
 
 
 def main():
     config = configparser.ConfigParser()
-    stocks_config = configparser.ConfigParser()
     args = parse_args()
 
-    portfolio = Portfolio()
-    graphs = []
-
     # get config path
     config_path = "config.ini"
-    portfolio_path = "portfolio.ini"
+    portfolio_paths = ["portfolio.ini"]
     if args.config:
         config_path = args.config
     if args.portfolio_config:
-        portfolio_path = args.portfolio_config
+        portfolio_paths = args.portfolio_config
 
     # generate config files
     if args.generate_config:
-        gen_config_files(config_path, portfolio_path)
+        gen_config_files(config_path, portfolio_paths[0])
 
-    # read config files
+    # read config files, each portfolio.ini is kept separate
     config.read(config_path)
-    stocks_config.read(portfolio_path)
+    stocks_configs = []
+    for portfolio_path in portfolio_paths:
+        stocks_config = configparser.ConfigParser()
+        stocks_config.read(portfolio_path)
+        stocks_configs.append(stocks_config)
 
     # verify that config files are correct
-    verify_config_keys(config, stocks_config)
+    verify_config_keys(config)
+    for stocks_config in stocks_configs:
+        verify_portfolio_keys(stocks_config)
 
     # get timezone for graph
     cfg_timezone = config["General"]["timezone"]
@@ -62,16 +68,31 @@ def main():
     if args.height:
         graph_height = args.graph_height
 
-    portfolio.populate(stocks_config, args)
+    # download every series once, no matter how many portfolios it shows up in
+    fetch_plan = gen_fetch_plan(stocks_configs, args)
+    stocks = fetch_stocks(fetch_plan)
+
+    # everything is composed into a single frame and written out at once
+    frame = terminal.Frame(compact=args.compact)
+    for portfolio_path, stocks_config in zip(portfolio_paths, stocks_configs):
+        # only label the portfolios when there is more than one of them
+        portfolio = Portfolio(portfolio_path if len(portfolio_paths) > 1 else None)
+        portfolio.populate(stocks_config, args, stocks)
+
+        portfolio.gen_graphs(
+            config["General"]["independent_graphs"] == "True"
+            or args.independent_graphs,
+            graph_width,
+            graph_height,
+            cfg_timezone,
+        )
+        portfolio.print_graphs(frame)
+        portfolio.print_table(frame, rounding_mode)
+
+        if args.risk:
+            portfolio.print_risk(frame, rounding_mode)
 
-    portfolio.gen_graphs(
-        config["General"]["independent_graphs"] == "True" or args.independent_graphs,
-        graph_width,
-        graph_height,
-        cfg_timezone,
-    )
-    portfolio.print_graphs()
-    portfolio.print_table(rounding_mode)
+    frame.flush()
 
     return
 
@@ -113,6 +134,22 @@ def parse_args():
         type=str,
         help="specify time period for graphs (ex: 15m, 1h, 1d)",
     )
+    parser.add_argument(
+        "--compact",
+        action="store_true",
+        help="always use the compact table layout (used automatically on narrow terminals)",
+    )
+    parser.add_argument(
+        "--risk",
+        action="store_true",
+        help="show correlation, volatility and beta of your holdings",
+    )
+    parser.add_argument(
+        "--benchmark",
+        type=str,
+        default="SPY",
+        help="symbol to calculate beta against when using --risk (default is SPY)",
+    )
     parser.add_argument(
         "--config",
         type=str,
@@ -121,7 +158,8 @@ def parse_args():
     parser.add_argument(
         "--portfolio-config",
         type=str,
-        help="path to a portfolio.ini file with your list of stonks",
+        nargs="+",
+        help="path to one or more portfolio.ini files with your list of stonks",
     )
     parser.add_argument(
         "-g",
@@ -159,7 +197,7 @@ color=#FFFF00
         portfolio_file.write(example_portfolio_str)
 
 
-def verify_config_keys(config, stocks_config):
+def verify_config_keys(config):
     config_keys = {
         "DEFAULT": [],
         "Frame": ["width", "height"],
@@ -173,6 +211,8 @@ def verify_config_keys(config, stocks_config):
             print("Invalid config.ini, " + section + " is missing keys.")
             return
 
+
+def verify_portfolio_keys(stocks_config):
     # check that at least one stock is in portfolio.ini
     if list(stocks_config.keys()) == ["DEFAULT"]:
         print(
@@ -194,24 +234,92 @@ def verify_config_keys(config, stocks_config):
             )
 
 
-class Singleton(type):
-    _instances = {}
+def get_time_settings(args):
+    # get graph time interval and period
+    time_period = "1d"
+    time_interval = "1m"
+    if args.time_period:
+        time_period = args.time_period
+    if args.time_interval:
+        time_interval = args.time_interval
+    return time_period, time_interval
+
+
+def gen_fetch_plan(stocks_configs, args):
+    # every (symbol, period, interval) that any of the portfolios (or the benchmark) need,
+    # each one only once and in the order they were first seen
+    time_period, time_interval = get_time_settings(args)
+    symbols = []
+    for stocks_config in stocks_configs:
+        symbols += stocks_config.sections()
+    if args.risk:
+        symbols.append(args.benchmark)
+
+    # the set is only there for fast lookups, the list keeps the order
+    plan = []
+    planned = set()
+    for symbol in symbols:
+        key = (symbol, time_period, time_interval)
+        if key not in planned:
+            planned.add(key)
+            plan.append(key)
+    return plan
+
+
+def fetch_stocks(fetch_plan):
+    stocks = {}
+    for symbol, time_period, time_interval in fetch_plan:
+        stocks[(symbol, time_period, time_interval)] = download_stock(
+            symbol, time_period, time_interval
+        )
+    return stocks
+
+
+def download_stock(symbol, time_period, time_interval):
+    # get the stock data
+    with contextlib.redirect_stdout(
+        io.StringIO()
+    ):  # this suppress output (library doesn't have a silent mode?)
+        data = market.download(
+            tickers=symbol, period=time_period, interval=time_interval
+        )
 
-    def __call__(cls, *args, **kwargs):
-        if cls not in cls._instances:
-            cls._instances[cls] = super(Singleton, cls).__call__(*args, **kwargs)
-        return cls._instances[cls]
+    # keep the timestamps so the series can be lined up against each other later
+    timestamps = data.index.values
+    # just get the value at each minute
+    data = data[["Open"]].to_numpy()
+    data = [_[0] for _ in data]
+
+    # only keep as many bars as the time period can hold, but never less than we got
+    capacity = max(utils.calc_bar_count(time_period, time_interval) or 0, len(data), 1)
+    new_stock = Stock(symbol, capacity)
+    # and save that parsed data
+    new_stock.extend(data, timestamps)
+    return new_stock
 
 
 class Stock:
-    def __init__(self, symbol: str, *args, **kwargs):
+    def __init__(self, symbol: str, capacity: int, *args, **kwargs):
         self.symbol = symbol
         self.value = 0
-        self.data = []
-        self.graph = False  # are we going to be graphing this stock?
+        # both are capped at capacity bars, the oldest bars are dropped first
+        self.data = series.RingSeries(capacity)
+        self.timestamps = deque(maxlen=capacity)
         self.color = None
         return
 
+    def append(self, value, timestamp):
+        self.data.append(value)
+        self.timestamps.append(timestamp)
+        # save the current stock value
+        self.value = self.data[-1]
+        return
+
+    def extend(self, values, timestamps):
+        for value, timestamp in zip(values, timestamps):
+            self.append(value, timestamp)
+        return
+
     def calc_value(self, stocks_count):
         return self.data[-1] * stocks_count
 
@@ -224,6 +332,19 @@ class Stock:
     def get_data(self):
         return self.data
 
+    def get_timestamps(self):
+        # the deque doesn't keep the dtype, and an empty one would otherwise become floats
+        return np.asarray(self.timestamps, dtype="datetime64[ns]")
+
+    def get_low(self):
+        return self.data.get_min()
+
+    def get_high(self):
+        return self.data.get_max()
+
+    def get_avg(self):
+        return self.data.get_avg()
+
     def __str__(self):
         return (
             "Stock:"
@@ -232,20 +353,23 @@ class Stock:
             + str(self.value)
             + " "
             + str(len(self.data))
-            + " "
-            + str(self.graph)
         )
 
 
-class Portfolio(metaclass=Singleton):
-    def __init__(self, *args, **kwargs):
+class Portfolio:
+    def __init__(self, name=None, *args, **kwargs):
+        self.name = name
         self.stocks = []
         self.stocks_metadata = {}
         self.initial_value = 0
         self.color_list = []
+        self.graph_list = []  # are we going to be graphing each stock?
+        self.benchmark = None
         return
 
-    def add_stock(self, stock: Stock, count, value, color):
+    def add_stock(self, stock: Stock, count, value, color, graph=False):
+        # stocks can be shared with other portfolios, so anything specific to this
+        # portfolio is kept here rather than on the stock itself
         self.stocks.append(stock)
         self.stocks_metadata[stock.symbol] = [float(count), float(value)]
         self.initial_value += (
@@ -253,6 +377,7 @@ class Portfolio(metaclass=Singleton):
             * self.stocks_metadata[stock.symbol][1]
         )
         self.color_list.append(color)
+        self.graph_list.append(graph)
         return
 
     def get_stocks(self):
@@ -268,40 +393,18 @@ class Portfolio(metaclass=Singleton):
         for stock in self.stocks:
             self.color_list.append(stock.color)
 
-    def populate(self, stocks_config, args):
+    def populate(self, stocks_config, args, stocks):
+        # stocks holds the already downloaded series, keyed the same as the fetch plan
+        time_period, time_interval = get_time_settings(args)
 
         for stock in stocks_config.sections():
-            new_stock = Stock(stock)
-
-            # get graph time interval and period
-            time_period = "1d"
-            time_interval = "1m"
-            if args.time_period:
-                time_period = args.time_period
-            if args.time_interval:
-                time_interval = args.time_interval
-
-            # get the stock data
-            with contextlib.redirect_stdout(
-                io.StringIO()
-            ):  # this suppress output (library doesn't have a silent mode?)
-                data = market.download(
-                    tickers=stock, period=time_period, interval=time_interval
-                )
-
-            # just get the value at each minute
-            data = data[["Open"]].to_numpy()
-            data = [_[0] for _ in data]
-            # and save that parsed data
-            new_stock.data = data
-
-            # save the current stock value
-            new_stock.value = data[-1]
+            new_stock = stocks[(stock, time_period, time_interval)]
 
             # are we graphing this stock?
+            graph = False
             if "graph" in list(stocks_config[stock].keys()):
                 if stocks_config[stock]["graph"] == "True":
-                    new_stock.graph = True
+                    graph = True
 
             if "owned" in list(stocks_config[stock].keys()):
                 count = float(stocks_config[stock]["owned"])
@@ -337,28 +440,34 @@ class Portfolio(metaclass=Singleton):
                 color = None
 
             # finally, add the stock to the portfolio
-            self.add_stock(new_stock, count, bought_at, color)
+            self.add_stock(new_stock, count, bought_at, color, graph)
+
+        # the benchmark is only needed for the risk report
+        if args.risk:
+            self.benchmark = stocks[(args.benchmark, time_period, time_interval)]
 
     def gen_graphs(self, independent_graphs, graph_width, graph_height, cfg_timezone):
         graphs = []
         if not independent_graphs:
             graphing_list = []
-            for stock in self.get_stocks():
-                if stock.graph:
+            graphing_colors = []
+            for i, stock in enumerate(self.get_stocks()):
+                if self.graph_list[i]:
                     graphing_list.append(stock)
+                    graphing_colors.append(self.color_list[i])
             if len(graphing_list) > 0:
                 graphs.append(
                     Graph(
                         graphing_list,
                         graph_width,
                         graph_height,
-                        self.color_list[: len(graphing_list)],
+                        graphing_colors,
                         timezone=cfg_timezone,
                     )
                 )
         else:
             for i, stock in enumerate(self.get_stocks()):
-                if stock.graph:
+                if self.graph_list[i]:
                     graphs.append(
                         Graph(
                             [stock],
@@ -373,12 +482,73 @@ class Portfolio(metaclass=Singleton):
         self.graphs = graphs
         return
 
-    def print_graphs(self):
+    def print_graphs(self, frame):
         for graph in self.graphs:
-            graph.draw()
+            graph.draw(frame)
         return
 
-    def print_table(self, mode):
+    def gen_table_row(self, stock, low, high, avg, mode):
+        # builds the table cells for a single stock, the last item is the color flag
+        line = []
+        change_d = utils.round_value(
+            stock.get_curr() - stock.get_open(), mode, 2
+        )  # change
+        change_p = utils.round_value(
+            (stock.get_curr() - stock.get_open()) / stock.get_curr() * 100, mode, 2
+        )  # change %
+        line.append(stock.symbol)  # symbol
+        line.append(
+            "$" + str(utils.round_value(stock.get_curr(), mode, 2))
+        )  # current value
+        if change_d >= 0:  # insert the changes into the array
+            line.append("+$" + str(change_d))
+            line.append("+" + str(change_p) + "%")
+        else:
+            line.append(
+                "-$" + str(change_d)[1:]
+            )  # string stripping here is to remove the native '-' sign
+            line.append("-" + str(change_p)[1:] + "%")
+        line.append("$" + str(utils.round_value(low, mode, 2)))  # low
+        line.append("$" + str(utils.round_value(high, mode, 2)))  # high
+        line.append("$" + str(utils.round_value(avg, mode, 2)))  # avg
+        line.append(
+            str(round(self.stocks_metadata[stock.symbol][0], 3))
+        )  # number of stocks owned
+        line.append(
+            "$"
+            + str(
+                utils.round_value(
+                    stock.calc_value(self.stocks_metadata[stock.symbol][0]), mode, 2
+                )
+            )
+        )
+        line.append(True if change_d >= 0 else False)
+        return line
+
+    def gen_change_line(self, label, value_gained, mode, format_str):
+        # builds a colored "value gained" line of the totals section
+        percent = utils.round_value(value_gained / self.current_value * 100, mode, 2)
+        if value_gained >= 0:
+            return (
+                "{:25}".format(label)
+                + Fore.GREEN
+                + format_str.format(
+                    "+$" + str(utils.round_value(value_gained, mode, 2))
+                )
+                + format_str.format("+" + str(percent) + "%")
+                + Style.RESET_ALL
+            )
+        return (
+            "{:25}".format(label)
+            + Fore.RED
+            + format_str.format(
+                "-$" + str(utils.round_value(value_gained, mode, 2))[1:]
+            )
+            + format_str.format(str(percent) + "%")
+            + Style.RESET_ALL
+        )
+
+    def print_table(self, frame, mode):
         # table format:
         #   ticker    owned   last    change  change% low high    avg
         # each row will also get a bonus boolean at the end denoting what color to print the line:
@@ -388,170 +558,182 @@ class Portfolio(metaclass=Singleton):
         # additional things to print: portfolio total value, portfolio change (and change %)
 
         cell_width = 11  # buffer space between columns
-        table = [
-            [
-                "Ticker",
-                "Last",
-                "Change",
-                "Change%",
-                "Low",
-                "High",
-                "Avg",
-                "Owned",
-                "Aggregate Value",
-                None,
-            ]
+        header = [
+            "Ticker",
+            "Last",
+            "Change",
+            "Change%",
+            "Low",
+            "High",
+            "Avg",
+            "Owned",
+            "Aggregate Value",
         ]
-        table.append(
-            ["-" * cell_width for _ in range(len(table[0]))]
-        )  # this is the solid line under the header
-        table[-1].append(None)  # make sure that solid line is not colored
+        compact_header = [
+            "Ticker",
+            "Last",
+            "Chg",
+            "Chg%",
+            "Low",
+            "High",
+            "Avg",
+            "Owned",
+            "Value",
+        ]
+        table = []
         self.current_value = 0
         self.opening_value = 0
         for stock in self.stocks:
-            line = []
-            change_d = utils.round_value(
-                stock.get_curr() - stock.get_open(), mode, 2
-            )  # change
-            change_p = utils.round_value(
-                (stock.get_curr() - stock.get_open()) / stock.get_curr() * 100, mode, 2
-            )  # change %
-            line.append(stock.symbol)  # symbol
-            line.append(
-                "$" + str(utils.round_value(stock.get_curr(), mode, 2))
-            )  # current value
-            if change_d >= 0:  # insert the changes into the array
-                line.append("+$" + str(change_d))
-                line.append("+" + str(change_p) + "%")
-            else:
-                line.append(
-                    "-$" + str(change_d)[1:]
-                )  # string stripping here is to remove the native '-' sign
-                line.append("-" + str(change_p)[1:] + "%")
-            line.append(
-                "$" + str(utils.round_value(min(stock.get_data()), mode, 2))
-            )  # low
-            line.append(
-                "$" + str(utils.round_value(max(stock.get_data()), mode, 2))
-            )  # high
-            line.append(
-                "$"
-                + str(
-                    utils.round_value(
-                        sum(stock.get_data()) / len(stock.get_data()), mode, 2
-                    )
-                )
-            )  # avg
-            line.append(
-                str(round(self.stocks_metadata[stock.symbol][0], 3))
-            )  # number of stocks owned
-            line.append(
-                "$"
-                + str(
-                    utils.round_value(
-                        stock.calc_value(self.stocks_metadata[stock.symbol][0]), mode, 2
-                    )
+            low, high, avg = stock.get_low(), stock.get_high(), stock.get_avg()
+            owned = self.stocks_metadata[stock.symbol][0]
+            table.append(
+                frame.cached_row(
+                    (self.name, stock.symbol),
+                    (stock.get_curr(), stock.get_open(), low, high, avg, owned, mode),
+                    lambda: self.gen_table_row(stock, low, high, avg, mode),
                 )
             )
-            line.append(True if change_d >= 0 else False)
-            table.append(line)
 
             # just add in the total value seeing as we're iterating stocks anyways
-            self.current_value += stock.calc_value(
-                self.stocks_metadata[stock.symbol][0]
-            )
+            self.current_value += stock.calc_value(owned)
             # and the opening value of all the tracked stocks
-            self.opening_value += (
-                stock.get_open() * self.stocks_metadata[stock.symbol][0]
+            self.opening_value += stock.get_open() * owned
+
+        # the tab indent counts as 8 columns
+        indent = "\t"
+        widths = [cell_width] * len(header)
+        if frame.is_compact(8 + cell_width * len(header)):
+            # shrink every column down to its widest cell plus a single space
+            indent = ""
+            header = compact_header
+            widths = [
+                max([len(header[i])] + [len(line[i]) for line in table]) + 1
+                for i in range(len(header))
+            ]
+
+        if self.name is None:
+            frame.line("\nPortfolio Summary:\n")
+        else:
+            frame.line("\nPortfolio Summary (" + self.name + "):\n")
+        frame.line(terminal.layout_row(header, widths, indent))
+        frame.line(
+            terminal.layout_row(["-" * width for width in widths], widths, indent)
+        )
+        for line in table:
+            frame.line(
+                frame.cached_row(
+                    ("layout", self.name, line[0]),
+                    (tuple(line), tuple(widths), indent),
+                    lambda: (Fore.GREEN if line[-1] else Fore.RED)
+                    + terminal.layout_row(line[:-1], widths, indent)
+                    + Style.RESET_ALL,
+                )
             )
 
-        print("\nPortfolio Summary:\n")
         format_str = "{:" + str(cell_width) + "}"
-        for line in table:
-            if line[-1] is None:
-                pass
-            elif line[-1]:
-                print(Fore.GREEN, end="")
-            else:
-                print(Fore.RED, end="")
-            print("\t" + "".join([format_str.format(item) for item in line[:-1]]))
-            print(Style.RESET_ALL, end="")
-        print(
+        frame.line(
             "\n"
             + "{:25}".format("Total Value: ")
             + format_str.format("$" + str(round(self.current_value, 2)))
         )
-        value_gained_day = self.current_value - self.opening_value
-        if value_gained_day >= 0:
-            print("{:25}".format("Value Gained Today: "), end="")
-            print(Fore.GREEN, end="")
-            print(
-                format_str.format(
-                    "+$" + str(utils.round_value(value_gained_day, mode, 2))
-                )
-                + format_str.format(
-                    "+"
-                    + str(
-                        utils.round_value(
-                            value_gained_day / self.current_value * 100, mode, 2
-                        )
-                    )
-                    + "%"
-                )
+        frame.line(
+            self.gen_change_line(
+                "Value Gained Today: ",
+                self.current_value - self.opening_value,
+                mode,
+                format_str,
             )
-        else:
-            print("{:25}".format("Value Gained Today: "), end="")
-            print(Fore.RED, end="")
-            print(
-                format_str.format(
-                    "-$" + str(utils.round_value(value_gained_day, mode, 2))[1:]
-                )
-                + format_str.format(
-                    str(
-                        utils.round_value(
-                            value_gained_day / self.current_value * 100, mode, 2
-                        )
-                    )
-                    + "%"
-                )
+        )
+        frame.line(
+            self.gen_change_line(
+                "Value Gained Overall: ",
+                self.current_value - self.initial_value,
+                mode,
+                format_str,
+            )
+        )
+        return
+
+    def print_risk(self, frame, mode):
+        # one column per holding, plus the benchmark as the final column
+        columns = self.stocks + [self.benchmark]
+        weights = [
+            stock.calc_value(self.stocks_metadata[stock.symbol][0])
+            for stock in self.stocks
+        ]
+        try:
+            for stock in columns:
+                if len(stock.data) == 0:
+                    raise ValueError("No price data for " + stock.symbol)
+            prices = risk.align_series(
+                [stock.get_timestamps() for stock in columns],
+                [stock.data.to_list() for stock in columns],
             )
-        print(Style.RESET_ALL, end="")
+            report = risk.compute_risk(prices, weights)
+        except ValueError as e:
+            frame.line("\nUnable to calculate portfolio risk: " + str(e))
+            return
 
-        value_gained_all = self.current_value - self.initial_value
-        if value_gained_all >= 0:
-            print("{:25}".format("Value Gained Overall: "), end="")
-            print(Fore.GREEN, end="")
-            print(
-                format_str.format(
-                    "+$" + str(utils.round_value(value_gained_all, mode, 2))
-                )
-                + format_str.format(
-                    "+"
-                    + str(
-                        utils.round_value(
-                            value_gained_all / self.current_value * 100, mode, 2
-                        )
-                    )
-                    + "%"
+        cell_width = 11
+        format_str = "{:" + str(cell_width) + "}"
+        symbols = [stock.symbol for stock in self.stocks]
+        widths = [cell_width] * 3
+
+        frame.line(
+            "\nPortfolio Risk (per bar, "
+            + str(report["bars"])
+            + " bars vs. "
+            + self.benchmark.symbol
+            + "):\n"
+        )
+        frame.line(terminal.layout_row(["Ticker", "Vol%", "Beta"], widths, "\t"))
+        frame.line(terminal.layout_row(["-" * cell_width] * 3, widths, "\t"))
+        for i, symbol in enumerate(symbols):
+            frame.line(
+                terminal.layout_row(
+                    [
+                        symbol,
+                        str(utils.round_value(report["volatility"][i] * 100, mode, 4))
+                        + "%",
+                        str(utils.round_value(report["beta"][i], mode, 2)),
+                    ],
+                    widths,
+                    "\t",
                 )
             )
-        else:
-            print("{:25}".format("Value Gained Overall: "), end="")
-            print(Fore.RED, end="")
-            print(
-                format_str.format(
-                    "-$" + str(utils.round_value(value_gained_all, mode, 2))[1:]
-                )
-                + format_str.format(
-                    str(
-                        utils.round_value(
-                            value_gained_all / self.current_value * 100, mode, 2
-                        )
-                    )
-                    + "%"
-                )
+        frame.line(
+            "\n"
+            + "{:25}".format("Portfolio Volatility: ")
+            + format_str.format(
+                str(utils.round_value(report["portfolio_volatility"] * 100, mode, 4))
+                + "%"
             )
-        print(Style.RESET_ALL, end="")
+        )
+        frame.line(
+            "{:25}".format("Portfolio Beta: ")
+            + format_str.format(
+                str(utils.round_value(report["portfolio_beta"], mode, 2))
+            )
+        )
+
+        # only show as many holdings as fit on screen, the largest ones first
+        correlation = report["correlation"]
+        shown = risk.fit_heatmap(symbols, frame.get_width())
+        if shown < len(symbols):
+            largest = np.sort(np.argsort(weights)[::-1][:shown])
+            symbols = [symbols[i] for i in largest]
+            correlation = correlation[np.ix_(largest, largest)]
+            frame.line(
+                "\nCorrelation (largest "
+                + str(shown)
+                + " of "
+                + str(len(columns) - 1)
+                + " holdings):\n"
+            )
+        else:
+            frame.line("\nCorrelation:\n")
+        frame.line(risk.gen_heatmap(symbols, correlation))
+        return
 
 
 class Graph:
@@ -605,8 +787,8 @@ class Graph:
     def __call__(self):
         return self.graph
 
-    def draw(self):
-        print(self.graph)
+    def draw(self, frame):
+        frame.line(self.graph)
         return
 
     def gen_graph(self, auto_colors):
@@ -626,7 +808,7 @@ class Graph:
 
             self.plot.plot(
                 [self.start + timedelta(minutes=i) for i in range(len(stock.data))],
-                stock.data,
+                stock.data.to_list(),
                 lc=color,
                 label=stock.symbol,
             )
@@ -639,10 +821,10 @@ class Graph:
         y_max = 0
 
         for stock in self.stocks:
-            if y_min > min(stock.data):
-                y_min = min(stock.data)
-            if y_max < max(stock.data):
-                y_max = max(stock.data)
+            if y_min > stock.get_low():
+                y_min = stock.get_low()
+            if y_max < stock.get_high():
+                y_max = stock.get_high()
 
         return y_min, y_max
 
@@ -0,0 +1,124 @@
+import numpy as np
+
+
+# Aligns every series onto the union of all their timestamps, carrying the last
+# known price forward, then drops the leading rows where any series has no price yet.
+# Returns a (bars x series) price matrix.
+def align_series(timestamps: list, values: list):
+    all_times = np.unique(np.concatenate([np.asarray(t) for t in timestamps]))
+
+    prices = np.full((len(all_times), len(values)), np.nan)
+    for col, (times, data) in enumerate(zip(timestamps, values)):
+        idx = np.searchsorted(np.asarray(times), all_times, side="right") - 1
+        known = idx >= 0
+        prices[known, col] = np.asarray(data, dtype=float)[idx[known]]
+
+    return prices[~np.isnan(prices).any(axis=1)]
+
+
+# Computes the return covariance/correlation matrix, the per-holding and portfolio
+# volatility, and the beta of every holding (and of the portfolio) against the benchmark.
+# The benchmark series is expected to be the last column of the price matrix.
+# All values are per bar (ie. per time interval), they are not annualized.
+def compute_risk(prices, weights):
+    with np.errstate(divide="ignore", invalid="ignore"):
+        returns = np.diff(prices, axis=0) / prices[:-1]
+    returns = returns[np.isfinite(returns).all(axis=1)]
+    if returns.shape[0] < 2:
+        raise ValueError("Not enough overlapping bars to compute risk statistics")
+
+    # one covariance pass over holdings and benchmark together
+    cov_all = np.cov(returns, rowvar=False)
+    vol_all = np.sqrt(np.diag(cov_all))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        corr_all = cov_all / np.outer(vol_all, vol_all)
+    corr_all = np.nan_to_num(corr_all)
+    # a series with constant prices has no variance, but is still itself
+    np.fill_diagonal(corr_all, 1.0)
+
+    cov = cov_all[:-1, :-1]
+    bench_var = cov_all[-1, -1]
+    if bench_var > 0:
+        betas = cov_all[:-1, -1] / bench_var
+    else:
+        betas = np.zeros(cov.shape[0])
+
+    weights = np.asarray(weights, dtype=float)
+    total = weights.sum()
+    if total != 0:
+        weights = weights / total
+    else:
+        # nothing owned, treat every holding equally
+        weights = np.full(len(weights), 1 / len(weights))
+
+    return {
+        "covariance": cov,
+        "correlation": corr_all[:-1, :-1],
+        "volatility": vol_all[:-1],
+        "beta": betas,
+        "portfolio_volatility": float(np.sqrt(max(weights @ cov @ weights, 0))),
+        "portfolio_beta": float(weights @ betas),
+        "benchmark_volatility": float(vol_all[-1]),
+        "bars": prices.shape[0],
+    }
+
+
+# Maps a correlation in [-1, 1] to a background color: red for negative,
+# white for none, green for positive.
+def corr_to_rgb(value):
+    value = max(-1.0, min(1.0, float(value)))
+    fade = int(255 * (1 - abs(value)))
+    if value >= 0:
+        return (fade, 255, fade)
+    return (255, fade, fade)
+
+
+# Every cell of the heatmap, one per correlation rounded to two decimals (-1.00 to +1.00),
+# with its color escape codes already applied
+def gen_heatmap_cells(cell_width=7):
+    format_str = "{:^" + str(cell_width) + "}"
+    cells = []
+    for step in range(-100, 101):
+        r, g, b = corr_to_rgb(step / 100)
+        cells.append(
+            "\x1b[38;2;0;0;0m\x1b[48;2;{};{};{}m".format(r, g, b)
+            + format_str.format("{:+.2f}".format(step / 100))
+            + "\x1b[0m"
+        )
+    return np.array(cells, dtype=object)
+
+
+HEATMAP_CELLS = gen_heatmap_cells()
+
+
+def get_label_width(symbols: list):
+    return max([len(symbol) for symbol in symbols] + [6])
+
+
+# How many holdings fit across a heatmap of the given width, at least one is always shown
+def fit_heatmap(symbols: list, width, cell_width=7):
+    return max((width - get_label_width(symbols) - 1) // cell_width, 1)
+
+
+# Renders the correlation matrix as a colored grid, one cell per pair of holdings
+def gen_heatmap(symbols: list, correlation, cell_width=7):
+    label_width = get_label_width(symbols)
+    format_str = "{:^" + str(cell_width) + "}"
+    if cell_width != 7:
+        cells = gen_heatmap_cells(cell_width)
+    else:
+        cells = HEATMAP_CELLS
+
+    # look every cell up at once rather than formatting them one by one
+    steps = np.rint(np.clip(correlation, -1, 1) * 100).astype(int) + 100
+
+    lines = [
+        " " * label_width
+        + " "
+        + "".join([format_str.format(symbol[: cell_width - 1]) for symbol in symbols])
+    ]
+    for i, symbol in enumerate(symbols):
+        lines.append(
+            "{:<{}}".format(symbol, label_width) + " " + "".join(cells[steps[i]])
+        )
+    return "\n".join(lines)
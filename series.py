@@ -0,0 +1,90 @@
+from collections import deque
+
+
+class RingSeries:
+    # A fixed capacity series of values. Once full, every append overwrites the oldest
+    # value, so memory stays the same no matter how long the session runs. The low,
+    # high and sum of the values currently held are kept up to date on each append
+    # (monotonic deques for the low/high, a running total for the sum) so reading
+    # them never has to walk the whole series.
+    def __init__(self, capacity: int, values=(), *args, **kwargs):
+        if capacity < 1:
+            raise ValueError("The capacity of a series has to be at least 1")
+        self.capacity = capacity
+        self.values = [None] * capacity
+        self.start = 0  # position of the oldest value in self.values
+        self.count = 0  # number of values currently held
+        self.appended = 0  # total number of values ever appended
+        self.total = 0
+        # (append number, value) pairs, values increasing / decreasing front to back
+        self.min_deque = deque()
+        self.max_deque = deque()
+        self.extend(values)
+        return
+
+    def append(self, value):
+        value = float(value)
+        end = (self.start + self.count) % self.capacity
+        if self.count == self.capacity:
+            # full, so the oldest value is dropped to make room
+            self.total -= self.values[self.start]
+            self.start = (self.start + 1) % self.capacity
+        else:
+            self.count += 1
+        self.values[end] = value
+        self.total += value
+
+        # drop anything that can no longer be the low / high
+        while self.min_deque and self.min_deque[-1][1] >= value:
+            self.min_deque.pop()
+        self.min_deque.append((self.appended, value))
+        while self.max_deque and self.max_deque[-1][1] <= value:
+            self.max_deque.pop()
+        self.max_deque.append((self.appended, value))
+
+        # and anything that has fallen out of the buffer
+        oldest = self.appended - self.count + 1
+        if self.min_deque[0][0] < oldest:
+            self.min_deque.popleft()
+        if self.max_deque[0][0] < oldest:
+            self.max_deque.popleft()
+
+        self.appended += 1
+        if self.appended % self.capacity == 0:
+            # re-add the sum every time around the buffer so float error can't build up
+            self.total = sum(self)
+        return
+
+    def extend(self, values):
+        for value in values:
+            self.append(value)
+        return
+
+    def get_min(self):
+        return self.min_deque[0][1]
+
+    def get_max(self):
+        return self.max_deque[0][1]
+
+    def get_sum(self):
+        return self.total
+
+    def get_avg(self):
+        return self.total / self.count
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += self.count
+        if not 0 <= index < self.count:
+            raise IndexError("series index out of range")
+        return self.values[(self.start + index) % self.capacity]
+
+    def __iter__(self):
+        for i in range(self.count):
+            yield self.values[(self.start + i) % self.capacity]
+
+    def to_list(self):
+        return list(self)
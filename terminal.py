@@ -0,0 +1,64 @@
+import re
+import sys
+import shutil
+
+ANSI_ESCAPE = re.compile(r"\x1b\[[0-9;]*[A-Za-z]")
+
+
+# Strips all the ANSI escape codes (colors, styles, cursor movement) from a string
+def strip_ansi(text):
+    return ANSI_ESCAPE.sub("", text)
+
+
+# Pads every cell out to its column width, cells wider than their column are left as is
+def layout_row(cells: list, widths: list, indent=""):
+    return indent + "".join(
+        ["{:{}}".format(cell, width) for cell, width in zip(cells, widths)]
+    )
+
+
+class Frame:
+    # Collects everything that is going to be shown on screen (graphs, tables, totals)
+    # so it can be written out with one write and one flush instead of a print per
+    # cell. Formatted rows can be cached between frames so unchanged rows are not
+    # formatted again on every refresh.
+    def __init__(self, stream=None, compact=False, *args, **kwargs):
+        self.stream = stream if stream is not None else sys.stdout
+        self.buffer = []
+        self.row_cache = {}
+        self.force_compact = compact
+        self.tty = self.stream.isatty() if hasattr(self.stream, "isatty") else False
+        self.color = self.tty
+        return
+
+    def line(self, text=""):
+        self.buffer.append(text + "\n")
+        return
+
+    def get_width(self):
+        return shutil.get_terminal_size().columns
+
+    def is_compact(self, table_width):
+        # use the compact layout when asked to or when the table would wrap on screen
+        return self.force_compact or (self.tty and table_width > self.get_width())
+
+    def cached_row(self, key, inputs, build):
+        # only rebuild the row if anything it was built from has changed
+        cached = self.row_cache.get(key)
+        if cached is not None and cached[0] == inputs:
+            return cached[1]
+        row = build()
+        self.row_cache[key] = (inputs, row)
+        return row
+
+    def render(self):
+        text = "".join(self.buffer)
+        if not self.color:
+            text = strip_ansi(text)
+        return text
+
+    def flush(self):
+        self.stream.write(self.render())
+        self.stream.flush()
+        self.buffer = []
+        return
@@ -15,3 +15,33 @@ def round_value(value, mode, decimal_places):
 
         factor = 10.0 ** decimal_places
         return trunc(value * factor) / factor
+
+
+# Number of seconds in each of the time units yfinance periods and intervals use
+TIME_UNITS = {
+    "m": 60,
+    "h": 60 * 60,
+    "d": 60 * 60 * 24,
+    "wk": 60 * 60 * 24 * 7,
+    "mo": 60 * 60 * 24 * 31,
+    "y": 60 * 60 * 24 * 366,
+}
+
+
+# Converts a period or interval string (ex: 15m, 1h, 5d, 3mo) to seconds, None if it can't be parsed
+def parse_duration(duration):
+    if duration == "ytd":
+        return TIME_UNITS["y"]
+    for unit in sorted(TIME_UNITS, key=len, reverse=True):
+        if duration.endswith(unit) and duration[: -len(unit)].isdigit():
+            return int(duration[: -len(unit)]) * TIME_UNITS[unit]
+    return None
+
+
+# The most bars a time period can hold at a given time interval, None if it isn't bounded (ex: max)
+def calc_bar_count(time_period, time_interval):
+    period = parse_duration(time_period)
+    interval = parse_duration(time_interval)
+    if period is None or interval is None:
+        return None
+    return max(period // interval, 1)